@@ -1,12 +1,13 @@
 import os
 
+# Make TensorFlow log less verbose
+os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
+
 import flwr as fl
 import tensorflow as tf
 
 SUBSET_SIZE = 1000
 
-# Make TensorFlow log less verbose
-os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
 
 def get_model():
     model = tf.keras.models.Sequential([
@@ -2,15 +2,15 @@ import argparse
 import os
 from pathlib import Path
 
+# Make TensorFlow logs less verbose
+os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
+
 import tensorflow as tf
 
 import flwr as fl
 
 from flwr_datasets import FederatedDataset
 
-# Make TensorFlow logs less verbose
-os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
-
 
 # Define Flower client
 class CifarClient(fl.client.NumPyClient):
@@ -1,5 +1,8 @@
 import os
 
+# Make TensorFlow log less verbose
+os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
+
 import flwr as fl
 import numpy as np
 import tensorflow as tf
@@ -7,10 +10,6 @@ from sklearn.metrics import accuracy_score, recall_score, precision_score, f1_sc
 from flwr_datasets import FederatedDataset
 
 
-# Make TensorFlow log less verbose
-os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
-
-
 # Load model (MobileNetV2)
 model = tf.keras.applications.MobileNetV2((32, 32, 3), classes=10, weights=None)
 model.compile("adam", "sparse_categorical_crossentropy", metrics=["accuracy"])
@@ -1,6 +1,9 @@
 import argparse
 import os
 
+# Make TensorFlow logs less verbose
+os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
+
 import tensorflow as tf
 from tensorflow_privacy.privacy.optimizers.dp_optimizer_keras_vectorized import (
     VectorizedDPKerasSGDOptimizer,
@@ -11,9 +14,6 @@ import flwr as fl
 import common
 
 
-# Make TensorFlow logs less verbose
-os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
-
 # global for tracking privacy
 PRIVACY_LOSS = 0
 
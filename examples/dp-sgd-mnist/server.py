@@ -1,15 +1,15 @@
 import argparse
 import os
 
+# Make TensorFlow logs less verbose
+os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
+
 import tensorflow as tf
 
 import flwr as fl
 
 import common
 
-# Make TensorFlow logs less verbose
-os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
-
 
 def get_evaluate_fn(model):
     """Return an evaluation function for server-side evaluation."""
@@ -1,5 +1,9 @@
 import os
 import argparse
+
+# Make TensorFlow log less verbose
+os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
+
 import flwr as fl
 import tensorflow as tf
 import logging
@@ -10,9 +14,6 @@ from model.model import Model
 logging.basicConfig(level=logging.INFO)  # Configure logging
 logger = logging.getLogger(__name__)  # Create logger for the module
 
-# Make TensorFlow log less verbose
-os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
-
 # Parse command line arguments
 parser = argparse.ArgumentParser(description="Flower client")
 
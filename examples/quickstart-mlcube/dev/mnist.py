@@ -13,13 +13,13 @@ import sys
 from enum import Enum
 from typing import List
 
+os.environ["TF_CPP_MIN_LOG_LEVEL"] = "2"  # Remove warning messages
+
 import numpy as np
 import tensorflow as tf
 import yaml
 from tensorflow.keras.utils import get_file
 
-os.environ["TF_CPP_MIN_LOG_LEVEL"] = "2"  # Remove warning messages
-
 logger = logging.getLogger(__name__)
 
 
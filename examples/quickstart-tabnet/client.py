@@ -1,4 +1,8 @@
 import os
+
+# Make TensorFlow log less verbose
+os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
+
 import flwr as fl
 import tensorflow as tf
 import tensorflow_datasets as tfds
@@ -38,8 +42,6 @@ def prepare_iris_dataset():
 
 
 ds_train, ds_test, feature_columns = prepare_iris_dataset()
-# Make TensorFlow log less verbose
-os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
 
 # Load TabNet model
 model = tabnet.TabNetClassifier(
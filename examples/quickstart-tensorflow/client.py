@@ -1,13 +1,13 @@
 import argparse
 import os
 
+# Make TensorFlow log less verbose
+os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
+
 from flwr.client import ClientApp, NumPyClient
 import tensorflow as tf
 from flwr_datasets import FederatedDataset
 
-# Make TensorFlow log less verbose
-os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
-
 # Parse arguments
 parser = argparse.ArgumentParser(description="Flower")
 parser.add_argument(
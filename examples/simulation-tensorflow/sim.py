@@ -2,6 +2,9 @@ import os
 import argparse
 from typing import Dict, List, Tuple
 
+# Make TensorFlow logs less verbose
+os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
+
 import tensorflow as tf
 
 import flwr as fl
@@ -11,9 +14,6 @@ from flwr.simulation.ray_transport.utils import enable_tf_gpu_growth
 from datasets import Dataset
 from flwr_datasets import FederatedDataset
 
-# Make TensorFlow logs less verbose
-os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
-
 parser = argparse.ArgumentParser(description="Flower Simulation with Tensorflow/Keras")
 
 parser.add_argument(
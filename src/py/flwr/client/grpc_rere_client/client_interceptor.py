@@ -15,7 +15,6 @@
 """Flower client interceptor."""
 
 
-import base64
 import collections
 from typing import Any, Callable, Optional, Sequence, Tuple, Union
 
@@ -37,8 +36,9 @@ from flwr.proto.fleet_pb2 import (  # pylint: disable=E0611
     PushTaskResRequest,
 )
 
-_PUBLIC_KEY_HEADER = "public-key"
-_AUTH_TOKEN_HEADER = "auth-token"
+# Binary headers (`-bin` suffix), so gRPC passes the raw key and token bytes through
+_PUBLIC_KEY_HEADER = "public-key-bin"
+_AUTH_TOKEN_HEADER = "auth-token-bin"
 
 Request = Union[
     CreateNodeRequest,
@@ -85,9 +85,7 @@ class AuthenticateClientInterceptor(grpc.UnaryUnaryClientInterceptor):  # type:
         self.public_key = public_key
         self.shared_secret: Optional[bytes] = None
         self.server_public_key: Optional[ec.EllipticCurvePublicKey] = None
-        self.encoded_public_key = base64.urlsafe_b64encode(
-            public_key_to_bytes(self.public_key)
-        )
+        self.public_key_bytes = public_key_to_bytes(self.public_key)
 
     def intercept_unary_unary(
         self,
@@ -109,7 +107,7 @@ class AuthenticateClientInterceptor(grpc.UnaryUnaryClientInterceptor):  # type:
         metadata.append(
             (
                 _PUBLIC_KEY_HEADER,
-                self.encoded_public_key,
+                self.public_key_bytes,
             )
         )
 
@@ -131,11 +129,9 @@ class AuthenticateClientInterceptor(grpc.UnaryUnaryClientInterceptor):  # type:
             metadata.append(
                 (
                     _AUTH_TOKEN_HEADER,
-                    base64.urlsafe_b64encode(
-                        compute_hmac(
-                            self.shared_secret, request.SerializeToString(True)
-                        )
-                    ),
+                    # The hmac is computed over the same bytes that are sent on
+                    # the wire, which the server verifies without re-serializing
+                    compute_hmac(self.shared_secret, request.SerializeToString()),
                 )
             )
 
@@ -148,8 +144,8 @@ class AuthenticateClientInterceptor(grpc.UnaryUnaryClientInterceptor):  # type:
 
         response = continuation(client_call_details, request)
         if postprocess:
-            server_public_key_bytes = base64.urlsafe_b64decode(
-                _get_value_from_tuples(_PUBLIC_KEY_HEADER, response.initial_metadata())
+            server_public_key_bytes = _get_value_from_tuples(
+                _PUBLIC_KEY_HEADER, response.initial_metadata()
             )
             self.server_public_key = bytes_to_public_key(server_public_key_bytes)
             self.shared_secret = generate_shared_key(
@@ -15,7 +15,6 @@
 """Flower client interceptor tests."""
 
 
-import base64
 import threading
 import unittest
 from concurrent import futures
@@ -72,11 +71,11 @@ class _MockServicer:
         """Handle unary call."""
         with self._lock:
             self._received_client_metadata = context.invocation_metadata()
-            self._received_message_bytes = request.SerializeToString(True)
+            self._received_message_bytes = request.SerializeToString()
 
             if isinstance(request, CreateNodeRequest):
                 context.send_initial_metadata(
-                    ((_PUBLIC_KEY_HEADER, self.server_public_key),)
+                    ((_PUBLIC_KEY_HEADER, public_key_to_bytes(self.server_public_key)),)
                 )
                 return CreateNodeResponse()
             if isinstance(request, DeleteNodeRequest):
@@ -208,7 +207,7 @@ class TestAuthenticateClientInterceptor(unittest.TestCase):
             create_node()
             expected_client_metadata = (
                 _PUBLIC_KEY_HEADER,
-                base64.urlsafe_b64encode(public_key_to_bytes(self._client_public_key)),
+                public_key_to_bytes(self._client_public_key),
             )
 
             # Assert
@@ -240,13 +239,11 @@ class TestAuthenticateClientInterceptor(unittest.TestCase):
             expected_client_metadata = (
                 (
                     _PUBLIC_KEY_HEADER,
-                    base64.urlsafe_b64encode(
-                        public_key_to_bytes(self._client_public_key)
-                    ),
+                    public_key_to_bytes(self._client_public_key),
                 ),
                 (
                     _AUTH_TOKEN_HEADER,
-                    base64.urlsafe_b64encode(expected_hmac),
+                    expected_hmac,
                 ),
             )
 
@@ -279,13 +276,11 @@ class TestAuthenticateClientInterceptor(unittest.TestCase):
             expected_client_metadata = (
                 (
                     _PUBLIC_KEY_HEADER,
-                    base64.urlsafe_b64encode(
-                        public_key_to_bytes(self._client_public_key)
-                    ),
+                    public_key_to_bytes(self._client_public_key),
                 ),
                 (
                     _AUTH_TOKEN_HEADER,
-                    base64.urlsafe_b64encode(expected_hmac),
+                    expected_hmac,
                 ),
             )
 
@@ -319,13 +314,11 @@ class TestAuthenticateClientInterceptor(unittest.TestCase):
             expected_client_metadata = (
                 (
                     _PUBLIC_KEY_HEADER,
-                    base64.urlsafe_b64encode(
-                        public_key_to_bytes(self._client_public_key)
-                    ),
+                    public_key_to_bytes(self._client_public_key),
                 ),
                 (
                     _AUTH_TOKEN_HEADER,
-                    base64.urlsafe_b64encode(expected_hmac),
+                    expected_hmac,
                 ),
             )
 
@@ -358,13 +351,11 @@ class TestAuthenticateClientInterceptor(unittest.TestCase):
             expected_client_metadata = (
                 (
                     _PUBLIC_KEY_HEADER,
-                    base64.urlsafe_b64encode(
-                        public_key_to_bytes(self._client_public_key)
-                    ),
+                    public_key_to_bytes(self._client_public_key),
                 ),
                 (
                     _AUTH_TOKEN_HEADER,
-                    base64.urlsafe_b64encode(expected_hmac),
+                    expected_hmac,
                 ),
             )
 
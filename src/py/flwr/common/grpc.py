@@ -16,7 +16,7 @@
 
 
 from logging import DEBUG
-from typing import Optional, Sequence
+from typing import Any, Optional, Sequence, Tuple
 
 import grpc
 
@@ -31,6 +31,7 @@ def create_channel(
     root_certificates: Optional[bytes] = None,
     max_message_length: int = GRPC_MAX_MESSAGE_LENGTH,
     interceptors: Optional[Sequence[grpc.UnaryUnaryClientInterceptor]] = None,
+    options: Optional[Sequence[Tuple[str, Any]]] = None,
 ) -> grpc.Channel:
     """Create a gRPC channel, either secure or insecure."""
     # Check for conflicting parameters
@@ -47,6 +48,8 @@ def create_channel(
         ("grpc.max_send_message_length", max_message_length),
         ("grpc.max_receive_message_length", max_message_length),
     ]
+    if options is not None:
+        channel_options.extend(options)
 
     if insecure:
         channel = grpc.insecure_channel(server_address, options=channel_options)
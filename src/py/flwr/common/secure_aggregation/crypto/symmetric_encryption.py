@@ -119,6 +119,24 @@ def verify_hmac(key: bytes, message: bytes, hmac_value: bytes) -> bool:
         return False
 
 
+def create_hmac_template(key: bytes) -> hmac.HMAC:
+    """Create a keyed hmac context to be reused via `verify_hmac_with_template`."""
+    return hmac.HMAC(key, hashes.SHA256())
+
+
+def verify_hmac_with_template(
+    hmac_template: hmac.HMAC, message: bytes, hmac_value: bytes
+) -> bool:
+    """Verify hmac of a message using a copy of a keyed hmac context."""
+    computed_hmac = hmac_template.copy()
+    computed_hmac.update(message)
+    try:
+        computed_hmac.verify(hmac_value)
+        return True
+    except InvalidSignature:
+        return False
+
+
 def ssh_types_to_elliptic_curve(
     private_key: serialization.SSHPrivateKeyTypes,
     public_key: serialization.SSHPublicKeyTypes,
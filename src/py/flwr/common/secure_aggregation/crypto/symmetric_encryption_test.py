@@ -17,9 +17,11 @@
 
 from .symmetric_encryption import (
     compute_hmac,
+    create_hmac_template,
     generate_key_pairs,
     generate_shared_key,
     verify_hmac,
+    verify_hmac_with_template,
 )
 
 
@@ -100,3 +102,27 @@ def test_wrong_message_hmac() -> None:
 
     # Assert
     assert verify_hmac(server_shared_secret, message, client_compute_hmac) is False
+
+
+def test_hmac_with_template() -> None:
+    """Test util function verify hmac with a reused hmac template."""
+    # Prepare
+    client_keys = generate_key_pairs()
+    server_keys = generate_key_pairs()
+    client_shared_secret = generate_shared_key(client_keys[0], server_keys[1])
+    server_shared_secret = generate_shared_key(server_keys[0], client_keys[1])
+    message = b"Flower is the future of AI"
+    other_message = b"Flower is not the future of AI"
+    hmac_template = create_hmac_template(server_shared_secret)
+
+    # Execute
+    client_compute_hmac = compute_hmac(client_shared_secret, message)
+
+    # Assert
+    assert verify_hmac_with_template(hmac_template, message, client_compute_hmac)
+    assert (
+        verify_hmac_with_template(hmac_template, other_message, client_compute_hmac)
+        is False
+    )
+    # The template is left untouched and can be reused
+    assert verify_hmac_with_template(hmac_template, message, client_compute_hmac)
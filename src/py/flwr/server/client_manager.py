@@ -19,7 +19,7 @@ import random
 import threading
 from abc import ABC, abstractmethod
 from logging import INFO
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from flwr.common.logger import log
 
@@ -66,6 +66,32 @@ class ClientManager(ABC):
         client : flwr.server.client_proxy.ClientProxy
         """
 
+    def register_many(self, clients: Sequence[ClientProxy]) -> List[bool]:
+        """Register multiple Flower ClientProxy instances.
+
+        Parameters
+        ----------
+        clients : Sequence[flwr.server.client_proxy.ClientProxy]
+
+        Returns
+        -------
+        success : List[bool]
+            Indicating for each ClientProxy if registration was successful.
+        """
+        return [self.register(client) for client in clients]
+
+    def unregister_many(self, clients: Sequence[ClientProxy]) -> None:
+        """Unregister multiple Flower ClientProxy instances.
+
+        This method is idempotent.
+
+        Parameters
+        ----------
+        clients : Sequence[flwr.server.client_proxy.ClientProxy]
+        """
+        for client in clients:
+            self.unregister(client)
+
     @abstractmethod
     def all(self) -> Dict[str, ClientProxy]:
         """Return all available clients."""
@@ -170,6 +196,63 @@ class SimpleClientManager(ClientManager):
             with self._cv:
                 self._cv.notify_all()
 
+    def register_many(self, clients: Sequence[ClientProxy]) -> List[bool]:
+        """Register multiple Flower ClientProxy instances.
+
+        Waiting threads are notified once for all clients instead of once per
+        client.
+
+        Parameters
+        ----------
+        clients : Sequence[flwr.server.client_proxy.ClientProxy]
+
+        Returns
+        -------
+        success : List[bool]
+            Indicating for each ClientProxy if registration was successful. False
+            if ClientProxy is already registered or can not be registered for any
+            reason.
+        """
+        # Subclasses overriding `register` get their override called per client
+        if type(self).register is not SimpleClientManager.register:
+            return super().register_many(clients)
+
+        success: List[bool] = []
+        with self._cv:
+            for client in clients:
+                if client.cid in self.clients:
+                    success.append(False)
+                    continue
+                self.clients[client.cid] = client
+                success.append(True)
+
+            if any(success):
+                self._cv.notify_all()
+
+        return success
+
+    def unregister_many(self, clients: Sequence[ClientProxy]) -> None:
+        """Unregister multiple Flower ClientProxy instances.
+
+        This method is idempotent.
+
+        Parameters
+        ----------
+        clients : Sequence[flwr.server.client_proxy.ClientProxy]
+        """
+        # Subclasses overriding `unregister` get their override called per client
+        if type(self).unregister is not SimpleClientManager.unregister:
+            super().unregister_many(clients)
+            return
+
+        with self._cv:
+            num_clients = len(self.clients)
+            for client in clients:
+                self.clients.pop(client.cid, None)
+
+            if len(self.clients) != num_clients:
+                self._cv.notify_all()
+
     def all(self) -> Dict[str, ClientProxy]:
         """Return all available clients."""
         return self.clients
@@ -15,9 +15,11 @@
 """Tests for ClientManager."""
 
 
+from typing import List
 from unittest.mock import MagicMock
 
 from flwr.server.client_manager import SimpleClientManager
+from flwr.server.client_proxy import ClientProxy
 from flwr.server.superlink.fleet.grpc_bidi.grpc_client_proxy import GrpcClientProxy
 
 
@@ -53,3 +55,66 @@ def test_simple_client_manager_unregister() -> None:
 
     # Assert
     assert len(client_manager) == 0
+
+
+def test_simple_client_manager_register_many() -> None:
+    """Tests if the register_many method works correctly."""
+    # Prepare
+    bridge = MagicMock()
+    clients = [GrpcClientProxy(cid=str(cid), bridge=bridge) for cid in range(3)]
+    client_manager = SimpleClientManager()
+    client_manager.register(clients[0])
+
+    # Execute
+    success = client_manager.register_many(clients)
+
+    # Assert
+    assert success == [False, True, True]
+    assert len(client_manager) == 3
+
+
+def test_simple_client_manager_unregister_many() -> None:
+    """Tests if the unregister_many method works correctly."""
+    # Prepare
+    bridge = MagicMock()
+    clients = [GrpcClientProxy(cid=str(cid), bridge=bridge) for cid in range(3)]
+    client_manager = SimpleClientManager()
+    client_manager.register_many(clients)
+
+    # Execute
+    client_manager.unregister_many(clients[:2])
+    client_manager.unregister_many(clients[:2])
+
+    # Assert
+    assert len(client_manager) == 1
+    assert "2" in client_manager.all()
+
+
+def test_simple_client_manager_many_calls_overridden_methods() -> None:
+    """Tests if register_many/unregister_many call overrides in subclasses."""
+    # Prepare
+    registered: List[str] = []
+    unregistered: List[str] = []
+
+    class _ClientManager(SimpleClientManager):
+        def register(self, client: ClientProxy) -> bool:
+            registered.append(client.cid)
+            return super().register(client)
+
+        def unregister(self, client: ClientProxy) -> None:
+            unregistered.append(client.cid)
+            super().unregister(client)
+
+    bridge = MagicMock()
+    clients = [GrpcClientProxy(cid=str(cid), bridge=bridge) for cid in range(3)]
+    client_manager = _ClientManager()
+
+    # Execute
+    success = client_manager.register_many(clients)
+    client_manager.unregister_many(clients[:2])
+
+    # Assert
+    assert success == [True, True, True]
+    assert registered == ["0", "1", "2"]
+    assert unregistered == ["0", "1"]
+    assert list(client_manager.all()) == ["2"]
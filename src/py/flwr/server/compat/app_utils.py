@@ -16,12 +16,26 @@
 
 
 import threading
+import weakref
+from logging import WARNING
 from typing import Dict, Tuple
 
+import grpc
+
+from flwr.common.logger import log
+
 from ..client_manager import ClientManager
 from ..compat.driver_client_proxy import DriverClientProxy
 from ..driver import Driver
 
+# Errors after which the Driver API is expected to become reachable again, e.g.,
+# when the SuperLink is restarting or sends `GOAWAY` with `ENHANCE_YOUR_CALM`
+_TRANSIENT_STATUS_CODES = {
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+}
+
 
 def start_update_client_manager_thread(
     driver: Driver,
@@ -33,9 +47,9 @@ def start_update_client_manager_thread(
     get all node_ids. Each node_id is then converted into a `DriverClientProxy`
     instance and stored in the `registered_nodes` dictionary with node_id as key.
 
-    New nodes will be added to the ClientManager via `client_manager.register()`,
-    and dead nodes will be removed from the ClientManager via
-    `client_manager.unregister()`.
+    New nodes will be added to the ClientManager via
+    `client_manager.register_many()`, and dead nodes will be removed from the
+    ClientManager via `client_manager.unregister_many()`.
 
     Parameters
     ----------
@@ -74,30 +88,71 @@ def _update_client_manager(
     """Update the nodes list in the client manager."""
     # Loop until the driver is disconnected
     registered_nodes: Dict[int, DriverClientProxy] = {}
+    # Proxies of nodes that left are kept while still referenced elsewhere, so a
+    # node reconnecting gets back the same `DriverClientProxy` instance
+    proxy_pool: "weakref.WeakValueDictionary[int, DriverClientProxy]" = (
+        weakref.WeakValueDictionary()
+    )
     while not f_stop.is_set():
-        all_node_ids = set(driver.get_node_ids())
-        dead_nodes = set(registered_nodes).difference(all_node_ids)
-        new_nodes = all_node_ids.difference(registered_nodes)
+        try:
+            all_node_ids = set(driver.get_node_ids())
+        except grpc.RpcError as err:
+            # Keep updating the client manager after transient errors instead of
+            # terminating the thread
+            if err.code() not in _TRANSIENT_STATUS_CODES:
+                raise
+            log(WARNING, "Failed to get node IDs: %s, retrying", err.code())
+            f_stop.wait(3)
+            continue
+
+        # Skip the diff if no node joined or left since the last update
+        if all_node_ids == registered_nodes.keys():
+            f_stop.wait(3)
+            continue
+
+        # Diff against the keys view directly instead of copying it into a set
+        dead_nodes = registered_nodes.keys() - all_node_ids
+        new_nodes = all_node_ids - registered_nodes.keys()
 
         # Unregister dead nodes
-        for node_id in dead_nodes:
-            client_proxy = registered_nodes[node_id]
-            client_manager.unregister(client_proxy)
-            del registered_nodes[node_id]
+        client_manager.unregister_many(
+            [registered_nodes.pop(node_id) for node_id in dead_nodes]
+        )
 
         # Register new nodes
-        for node_id in new_nodes:
-            client_proxy = DriverClientProxy(
-                node_id=node_id,
-                driver=driver,
-                anonymous=False,
-                run_id=driver.run_id,  # type: ignore
-            )
-            if client_manager.register(client_proxy):
-                registered_nodes[node_id] = client_proxy
-            else:
+        # Constructing a `DriverClientProxy` does not call the Driver API, so the
+        # proxies are built in a single pass with `run_id` looked up once
+        run_id: int = driver.run_id  # type: ignore
+        new_proxies = [
+            _get_or_create_proxy(proxy_pool, node_id, driver, run_id)
+            for node_id in new_nodes
+        ]
+        for client_proxy, success in zip(
+            new_proxies, client_manager.register_many(new_proxies)
+        ):
+            if not success:
                 raise RuntimeError("Could not register node.")
+            registered_nodes[client_proxy.node_id] = client_proxy
 
         # Sleep for 3 seconds
         if not f_stop.is_set():
             f_stop.wait(3)
+
+
+def _get_or_create_proxy(
+    proxy_pool: "weakref.WeakValueDictionary[int, DriverClientProxy]",
+    node_id: int,
+    driver: Driver,
+    run_id: int,
+) -> DriverClientProxy:
+    """Return the pooled `DriverClientProxy` for `node_id`, creating it on a miss."""
+    client_proxy = proxy_pool.get(node_id)
+    if client_proxy is None:
+        client_proxy = DriverClientProxy(
+            node_id=node_id,
+            driver=driver,
+            anonymous=False,
+            run_id=run_id,
+        )
+        proxy_pool[node_id] = client_proxy
+    return client_proxy
@@ -18,16 +18,42 @@
 import time
 import unittest
 from threading import Event
-from typing import Optional
+from typing import Callable, List, Optional
 from unittest.mock import Mock, patch
 
+import grpc
+
 from ..client_manager import SimpleClientManager
 from .app_utils import start_update_client_manager_thread
 
+_ORIGINAL_WAIT = Event.wait
+
+
+def _fast_wait(self: Event, timeout: Optional[float] = None) -> bool:
+    """Wait for a hundredth of `timeout`, so the update loop ticks quickly."""
+    if timeout is not None:
+        timeout /= 100
+    return _ORIGINAL_WAIT(self, timeout)
+
+
+def _wait_until(condition: Callable[[], bool], timeout: float = 10.0) -> None:
+    """Poll `condition` until it holds, failing after `timeout` seconds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Condition not met before timeout")
+        time.sleep(0.01)
+
 
 class TestUtils(unittest.TestCase):
     """Tests for utility functions."""
 
+    def setUp(self) -> None:
+        """Speed up the update loop by patching `Event.wait`."""
+        patcher = patch.object(Event, "wait", new=_fast_wait)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_start_update_client_manager_thread(self) -> None:
         """Test start_update_client_manager_thread function."""
         # Prepare
@@ -38,34 +64,104 @@ class TestUtils(unittest.TestCase):
         driver.run_id = 123
         driver.get_node_ids.return_value = expected_node_ids
         client_manager = SimpleClientManager()
-        original_wait = Event.wait
+        # Execute
+        thread, f_stop = start_update_client_manager_thread(driver, client_manager)
+        # Wait until all nodes are registered via `client_manager.sample()`
+        client_manager.sample(len(expected_node_ids))
+        # Retrieve all nodes in `client_manager`
+        node_ids = {proxy.node_id for proxy in client_manager.all().values()}
+        # Update the GetNodesResponse and wait until the `client_manager` is updated
+        driver.get_node_ids.return_value = updated_expected_node_ids
+        time.sleep(0.1)
+        # Retrieve all nodes in `client_manager`
+        updated_node_ids = {proxy.node_id for proxy in client_manager.all().values()}
+        # Stop the thread
+        f_stop.set()
 
-        def custom_wait(self: Event, timeout: Optional[float] = None) -> None:
-            if timeout is not None:
-                timeout /= 100
-            original_wait(self, timeout)
+        # Assert
+        assert node_ids == set(expected_node_ids)
+        assert updated_node_ids == set(updated_expected_node_ids)
 
+        # Exit
+        thread.join()
+
+    def test_update_client_manager_thread_survives_transient_error(self) -> None:
+        """Test start_update_client_manager_thread retries after UNAVAILABLE."""
+        # Prepare
+        expected_node_ids = list(range(10))
+        error = grpc.RpcError()
+        error.code = lambda: grpc.StatusCode.UNAVAILABLE
+        errors = [error]
+
+        def get_node_ids() -> List[int]:
+            if errors:
+                raise errors.pop()
+            return expected_node_ids
+
+        driver = Mock()
+        driver.run_id = 123
+        driver.get_node_ids.side_effect = get_node_ids
+        client_manager = SimpleClientManager()
         # Execute
-        # Patching Event.wait with our custom function
-        with patch.object(Event, "wait", new=custom_wait):
-            thread, f_stop = start_update_client_manager_thread(driver, client_manager)
-            # Wait until all nodes are registered via `client_manager.sample()`
-            client_manager.sample(len(expected_node_ids))
-            # Retrieve all nodes in `client_manager`
-            node_ids = {proxy.node_id for proxy in client_manager.all().values()}
-            # Update the GetNodesResponse and wait until the `client_manager` is updated
-            driver.get_node_ids.return_value = updated_expected_node_ids
-            time.sleep(0.1)
-            # Retrieve all nodes in `client_manager`
-            updated_node_ids = {
-                proxy.node_id for proxy in client_manager.all().values()
-            }
-            # Stop the thread
-            f_stop.set()
+        thread, f_stop = start_update_client_manager_thread(driver, client_manager)
+        # Wait until all nodes are registered via `client_manager.sample()`
+        client_manager.sample(len(expected_node_ids))
+        f_stop.set()
 
         # Assert
+        node_ids = {proxy.node_id for proxy in client_manager.all().values()}
         assert node_ids == set(expected_node_ids)
-        assert updated_node_ids == set(updated_expected_node_ids)
 
         # Exit
         thread.join()
+
+    def test_update_client_manager_thread_reuses_proxy(self) -> None:
+        """Test a reconnecting node gets back its previous `DriverClientProxy`."""
+        # Prepare
+        driver = Mock()
+        driver.run_id = 123
+        driver.get_node_ids.return_value = [0, 1]
+        client_manager = SimpleClientManager()
+
+        # Execute
+        thread, f_stop = start_update_client_manager_thread(driver, client_manager)
+        client_manager.sample(2)
+        proxy = client_manager.all()["1"]
+        # Node 1 leaves and reconnects
+        driver.get_node_ids.return_value = [0]
+        _wait_until(lambda: "1" not in client_manager.all())
+        driver.get_node_ids.return_value = [0, 1]
+        _wait_until(lambda: "1" in client_manager.all())
+        reconnected_proxy = client_manager.all()["1"]
+        f_stop.set()
+
+        # Assert
+        assert reconnected_proxy is proxy
+
+        # Exit
+        thread.join()
+
+    def test_update_client_manager_thread_skips_unchanged_nodes(self) -> None:
+        """Test the client manager is not updated while the nodes are unchanged."""
+        # Prepare
+        driver = Mock()
+        driver.run_id = 123
+        driver.get_node_ids.return_value = [0, 1]
+        client_manager = SimpleClientManager()
+
+        # Execute
+        with patch.object(
+            client_manager, "register_many", wraps=client_manager.register_many
+        ) as mock_register_many, patch.object(
+            client_manager, "unregister_many", wraps=client_manager.unregister_many
+        ) as mock_unregister_many:
+            thread, f_stop = start_update_client_manager_thread(driver, client_manager)
+            # Wait for several updates with the same nodes
+            _wait_until(lambda: driver.get_node_ids.call_count >= 5)
+            f_stop.set()
+            thread.join()
+
+        # Assert
+        assert mock_register_many.call_count == 1
+        assert mock_unregister_many.call_count == 1
+        assert set(client_manager.all()) == {"0", "1"}
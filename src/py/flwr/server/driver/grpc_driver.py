@@ -14,6 +14,7 @@
 # ==============================================================================
 """Flower gRPC Driver."""
 
+import itertools
 import time
 import warnings
 from logging import DEBUG, ERROR, WARNING
@@ -42,6 +43,7 @@ from flwr.proto.task_pb2 import TaskIns  # pylint: disable=E0611
 from .driver import Driver
 
 DEFAULT_SERVER_ADDRESS_DRIVER = "[::]:9091"
+DEFAULT_NUM_CHANNELS = 1
 
 ERROR_MESSAGE_DRIVER_NOT_CONNECTED = """
 [Driver] Error: Not connected.
@@ -52,86 +54,130 @@ Call `connect()` on the `GrpcDriverHelper` instance before calling any of the ot
 
 
 class GrpcDriverHelper:
-    """`GrpcDriverHelper` provides access to the gRPC Driver API/service."""
+    """`GrpcDriverHelper` provides access to the gRPC Driver API/service.
+
+    If `num_channels` is greater than one, calls are spread round-robin over that
+    many independent gRPC channels, so that concurrent calls do not have to share a
+    single HTTP/2 connection.
+    """
 
     def __init__(
         self,
         driver_service_address: str = DEFAULT_SERVER_ADDRESS_DRIVER,
         root_certificates: Optional[bytes] = None,
+        num_channels: int = DEFAULT_NUM_CHANNELS,
     ) -> None:
+        if num_channels < 1:
+            raise ValueError("`num_channels` must be at least 1")
         self.driver_service_address = driver_service_address
         self.root_certificates = root_certificates
-        self.channel: Optional[grpc.Channel] = None
-        self.stub: Optional[DriverStub] = None
+        self.num_channels = num_channels
+        self.channels: List[grpc.Channel] = []
+        self.stubs: List[DriverStub] = []
+        self._stub_index = itertools.count()
+
+    @property
+    def channel(self) -> Optional[grpc.Channel]:
+        """The first gRPC channel, or None if not connected."""
+        channels = self.channels
+        return channels[0] if channels else None
+
+    @property
+    def stub(self) -> Optional[DriverStub]:
+        """The stub of the first gRPC channel, or None if not connected."""
+        stubs = self.stubs
+        return stubs[0] if stubs else None
+
+    def _next_stub(self) -> Optional[DriverStub]:
+        """Return the stub to use for the next call, or None if not connected."""
+        stubs = self.stubs
+        if not stubs:
+            return None
+        # `next()` on `itertools.count` is atomic, no lock is needed
+        return stubs[next(self._stub_index) % len(stubs)]
 
     def connect(self) -> None:
         """Connect to the Driver API."""
         event(EventType.DRIVER_CONNECT)
-        if self.channel is not None or self.stub is not None:
+        if self.channels or self.stubs:
             log(WARNING, "Already connected")
             return
-        self.channel = create_channel(
-            server_address=self.driver_service_address,
-            insecure=(self.root_certificates is None),
-            root_certificates=self.root_certificates,
+        # Each channel of a pool uses its own subchannel pool, otherwise gRPC would
+        # share a single connection between all channels to the same address
+        options = (
+            [("grpc.use_local_subchannel_pool", 1)] if self.num_channels > 1 else None
         )
-        self.stub = DriverStub(self.channel)
+        self.channels = [
+            create_channel(
+                server_address=self.driver_service_address,
+                insecure=(self.root_certificates is None),
+                root_certificates=self.root_certificates,
+                options=options,
+            )
+            for _ in range(self.num_channels)
+        ]
+        self.stubs = [DriverStub(channel) for channel in self.channels]
         log(DEBUG, "[Driver] Connected to %s", self.driver_service_address)
 
     def disconnect(self) -> None:
         """Disconnect from the Driver API."""
         event(EventType.DRIVER_DISCONNECT)
-        if self.channel is None or self.stub is None:
+        if not self.channels or not self.stubs:
             log(DEBUG, "Already disconnected")
             return
-        channel = self.channel
-        self.channel = None
-        self.stub = None
-        channel.close()
+        channels = self.channels
+        self.channels = []
+        self.stubs = []
+        for channel in channels:
+            channel.close()
         log(DEBUG, "[Driver] Disconnected")
 
     def create_run(self, req: CreateRunRequest) -> CreateRunResponse:
         """Request for run ID."""
         # Check if channel is open
-        if self.stub is None:
+        stub = self._next_stub()
+        if stub is None:
             log(ERROR, ERROR_MESSAGE_DRIVER_NOT_CONNECTED)
             raise ConnectionError("`GrpcDriverHelper` instance not connected")
 
         # Call Driver API
-        res: CreateRunResponse = self.stub.CreateRun(request=req)
+        res: CreateRunResponse = stub.CreateRun(request=req)
         return res
 
     def get_nodes(self, req: GetNodesRequest) -> GetNodesResponse:
         """Get client IDs."""
         # Check if channel is open
-        if self.stub is None:
+        stub = self._next_stub()
+        if stub is None:
             log(ERROR, ERROR_MESSAGE_DRIVER_NOT_CONNECTED)
             raise ConnectionError("`GrpcDriverHelper` instance not connected")
 
         # Call gRPC Driver API
-        res: GetNodesResponse = self.stub.GetNodes(request=req)
+        res: GetNodesResponse = stub.GetNodes(request=req)
         return res
 
     def push_task_ins(self, req: PushTaskInsRequest) -> PushTaskInsResponse:
         """Schedule tasks."""
         # Check if channel is open
-        if self.stub is None:
+        stub = self._next_stub()
+        if stub is None:
             log(ERROR, ERROR_MESSAGE_DRIVER_NOT_CONNECTED)
             raise ConnectionError("`GrpcDriverHelper` instance not connected")
 
         # Call gRPC Driver API
-        res: PushTaskInsResponse = self.stub.PushTaskIns(request=req)
+        res: PushTaskInsResponse = stub.PushTaskIns(request=req)
         return res
 
     def pull_task_res(self, req: PullTaskResRequest) -> PullTaskResResponse:
         """Get task results."""
         # Check if channel is open
-        if self.stub is None:
+        stub = self._next_stub()
+        if stub is None:
             log(ERROR, ERROR_MESSAGE_DRIVER_NOT_CONNECTED)
             raise ConnectionError("`GrpcDriverHelper` instance not connected")
 
         # Call Driver API
-        res: PullTaskResResponse = self.stub.PullTaskRes(request=req)
+        res: PullTaskResResponse = stub.PullTaskRes(request=req)
         return res
 
 
@@ -155,17 +201,22 @@ class GrpcDriver(Driver):
         The identifier of the FAB used in the run.
     fab_version : str (default: None)
         The version of the FAB used in the run.
+    num_channels : int (default: 1)
+        The number of gRPC channels calls to the Driver API are spread over. Each
+        channel opens its own connection to the SuperLink.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         driver_service_address: str = DEFAULT_SERVER_ADDRESS_DRIVER,
         root_certificates: Optional[bytes] = None,
         fab_id: Optional[str] = None,
         fab_version: Optional[str] = None,
+        num_channels: int = DEFAULT_NUM_CHANNELS,
     ) -> None:
         self.addr = driver_service_address
         self.root_certificates = root_certificates
+        self.num_channels = num_channels
         self.driver_helper: Optional[GrpcDriverHelper] = None
         self.run_id: Optional[int] = None
         self.fab_id = fab_id if fab_id is not None else ""
@@ -179,6 +230,7 @@ class GrpcDriver(Driver):
             self.driver_helper = GrpcDriverHelper(
                 driver_service_address=self.addr,
                 root_certificates=self.root_certificates,
+                num_channels=self.num_channels,
             )
             self.driver_helper.connect()
             req = CreateRunRequest(fab_id=self.fab_id, fab_version=self.fab_version)
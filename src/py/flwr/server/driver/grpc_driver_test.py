@@ -29,7 +29,7 @@ from flwr.proto.driver_pb2 import (  # pylint: disable=E0611
 )
 from flwr.proto.task_pb2 import Task, TaskRes  # pylint: disable=E0611
 
-from .grpc_driver import GrpcDriver
+from .grpc_driver import GrpcDriver, GrpcDriverHelper
 
 
 class TestGrpcDriver(unittest.TestCase):
@@ -220,3 +220,57 @@ class TestGrpcDriver(unittest.TestCase):
 
         # Assert
         self.mock_grpc_driver_helper.disconnect.assert_not_called()
+
+
+class TestGrpcDriverHelper(unittest.TestCase):
+    """Tests for `GrpcDriverHelper` class."""
+
+    def test_calls_are_spread_over_channels(self) -> None:
+        """Test that calls are spread round-robin over all channels."""
+        # Prepare
+        stubs = [Mock(), Mock(), Mock()]
+        with patch(
+            "flwr.server.driver.grpc_driver.create_channel"
+        ) as mock_create_channel, patch(
+            "flwr.server.driver.grpc_driver.DriverStub", side_effect=stubs
+        ):
+            helper = GrpcDriverHelper(num_channels=3)
+            helper.connect()
+
+            # Execute
+            for _ in range(6):
+                helper.get_nodes(GetNodesRequest(run_id=61016))
+            helper.disconnect()
+
+        # Assert
+        self.assertEqual(mock_create_channel.call_count, 3)
+        for stub in stubs:
+            self.assertEqual(stub.GetNodes.call_count, 2)
+        self.assertEqual(helper.stubs, [])
+
+    def test_single_channel_by_default(self) -> None:
+        """Test that one channel is opened by default and exposed as `channel`."""
+        # Prepare
+        with patch(
+            "flwr.server.driver.grpc_driver.create_channel"
+        ) as mock_create_channel, patch(
+            "flwr.server.driver.grpc_driver.DriverStub"
+        ) as mock_stub:
+            helper = GrpcDriverHelper()
+
+            # Execute
+            helper.connect()
+
+        # Assert
+        mock_create_channel.assert_called_once()
+        self.assertIsNone(mock_create_channel.call_args.kwargs["options"])
+        self.assertIs(helper.channel, mock_create_channel.return_value)
+        self.assertIs(helper.stub, mock_stub.return_value)
+        helper.disconnect()
+        self.assertIsNone(helper.channel)
+        self.assertIsNone(helper.stub)
+
+    def test_invalid_num_channels(self) -> None:
+        """Test that at least one channel is required."""
+        with self.assertRaises(ValueError):
+            GrpcDriverHelper(num_channels=0)
@@ -88,6 +88,11 @@ class FleetServicer(fleet_pb2_grpc.FleetServicer):
     ) -> PushTaskResResponse:
         """Push TaskRes."""
         log(INFO, "FleetServicer.PushTaskRes")
+        if len(request.task_res_list) == 0:
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "`task_res_list` must contain at least one TaskRes",
+            )
         return message_handler.push_task_res(
             request=request,
             state=self.state_factory.state(),
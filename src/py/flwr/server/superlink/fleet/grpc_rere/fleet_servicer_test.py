@@ -0,0 +1,44 @@
+# Copyright 2024 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Fleet API gRPC request-response servicer tests."""
+
+
+import unittest
+from unittest.mock import MagicMock
+
+import grpc
+
+from flwr.proto.fleet_pb2 import PushTaskResRequest  # pylint: disable=E0611
+
+from .fleet_servicer import FleetServicer
+
+
+class TestFleetServicer(unittest.TestCase):
+    """Fleet servicer tests."""
+
+    def test_push_task_res_without_task_res(self) -> None:
+        """Test PushTaskRes rejects a request without any TaskRes."""
+        # Prepare
+        state_factory = MagicMock()
+        servicer = FleetServicer(state_factory)
+        context = MagicMock()
+        context.abort.side_effect = grpc.RpcError()
+
+        # Execute & Assert
+        with self.assertRaises(grpc.RpcError):
+            servicer.PushTaskRes(PushTaskResRequest(), context)
+        context.abort.assert_called_once()
+        assert context.abort.call_args.args[0] == grpc.StatusCode.INVALID_ARGUMENT
+        state_factory.state.return_value.store_task_res.assert_not_called()
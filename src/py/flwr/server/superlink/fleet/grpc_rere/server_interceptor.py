@@ -15,19 +15,20 @@
 """Flower server interceptor."""
 
 
-import base64
 from logging import WARNING
-from typing import Any, Callable, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Type, Union, cast
 
 import grpc
-from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives import hmac
+from google.protobuf.message import DecodeError
 
 from flwr.common.logger import log
 from flwr.common.secure_aggregation.crypto.symmetric_encryption import (
     bytes_to_private_key,
     bytes_to_public_key,
+    create_hmac_template,
     generate_shared_key,
-    verify_hmac,
+    verify_hmac_with_template,
 )
 from flwr.proto.fleet_pb2 import (  # pylint: disable=E0611
     CreateNodeRequest,
@@ -46,8 +47,9 @@ from flwr.proto.fleet_pb2 import (  # pylint: disable=E0611
 from flwr.proto.node_pb2 import Node  # pylint: disable=E0611
 from flwr.server.superlink.state import State
 
-_PUBLIC_KEY_HEADER = "public-key"
-_AUTH_TOKEN_HEADER = "auth-token"
+# Binary headers (`-bin` suffix), so gRPC passes the raw key and token bytes through
+_PUBLIC_KEY_HEADER = "public-key-bin"
+_AUTH_TOKEN_HEADER = "auth-token-bin"
 
 Request = Union[
     CreateNodeRequest,
@@ -68,14 +70,38 @@ Response = Union[
 ]
 
 
-def _get_value_from_tuples(
-    key_string: str, tuples: Sequence[Tuple[str, Union[str, bytes]]]
-) -> bytes:
-    value = next((value for key, value in tuples if key == key_string), "")
-    if isinstance(value, str):
-        return value.encode()
+def _verify_node_id_of_node(
+    _: State,
+    node_id: int,
+    request: Union[DeleteNodeRequest, PullTaskInsRequest, PingRequest],
+) -> bool:
+    return request.node.node_id == node_id
 
-    return value
+
+def _verify_node_id_of_push_task_res(
+    _: State, node_id: int, request: PushTaskResRequest
+) -> bool:
+    task_res_list = request.task_res_list
+    if len(task_res_list) == 0:
+        return False
+    return task_res_list[0].task.producer.node_id == node_id
+
+
+def _verify_node_id_of_get_run(
+    state: State, node_id: int, request: GetRunRequest
+) -> bool:
+    return node_id in state.get_nodes(request.run_id)
+
+
+# Map each authenticated request type to the function verifying that the request
+# belongs to `node_id`, so the request type is dispatched with one dict lookup
+_NODE_ID_VERIFIERS: Dict[Type[Request], Callable[[State, int, Any], bool]] = {
+    DeleteNodeRequest: _verify_node_id_of_node,
+    PullTaskInsRequest: _verify_node_id_of_node,
+    PingRequest: _verify_node_id_of_node,
+    PushTaskResRequest: _verify_node_id_of_push_task_res,
+    GetRunRequest: _verify_node_id_of_get_run,
+}
 
 
 class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
@@ -95,7 +121,15 @@ class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
             raise ValueError("Error loading authentication keys")
 
         self.server_private_key = bytes_to_private_key(private_key)
-        self.encoded_server_public_key = base64.urlsafe_b64encode(public_key)
+        # The server public key never changes, so the `CreateNode` response metadata
+        # is built only once
+        self._server_public_key_metadata = ((_PUBLIC_KEY_HEADER, public_key),)
+
+        # Cache mapping `client_public_key` to an hmac context keyed with the ECDH
+        # shared secret, so neither key agreement nor hmac key setup is repeated.
+        # Only known public keys bound to a node reach the hmac verification, so
+        # its size is bounded by the number of known client public keys
+        self._hmac_template_cache: Dict[bytes, hmac.HMAC] = {}
 
     def intercept_service(
         self,
@@ -117,73 +151,76 @@ class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
         self, method_handler: grpc.RpcMethodHandler
     ) -> grpc.RpcMethodHandler:
         def _generic_method_handler(
-            request: Request,
+            request_bytes: bytes,
             context: grpc.ServicerContext,
         ) -> Response:
-            client_public_key_bytes = base64.urlsafe_b64decode(
-                _get_value_from_tuples(
-                    _PUBLIC_KEY_HEADER, context.invocation_metadata()
-                )
-            )
+            # Values of binary headers are always `bytes`
+            metadata: Dict[str, bytes] = dict(context.invocation_metadata())
+            client_public_key_bytes = metadata.get(_PUBLIC_KEY_HEADER, b"")
             if client_public_key_bytes not in self.client_public_keys:
                 context.abort(grpc.StatusCode.UNAUTHENTICATED, "Access denied")
 
+            # The request is deserialized here rather than by gRPC, so that the hmac
+            # can be verified against the bytes received on the wire
+            try:
+                request: Request = method_handler.request_deserializer(request_bytes)
+            except DecodeError:
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Malformed request")
             if isinstance(request, CreateNodeRequest):
                 return self._create_authenticated_node(
                     client_public_key_bytes, request, context
                 )
 
-            # Verify hmac value
-            hmac_value = base64.urlsafe_b64decode(
-                _get_value_from_tuples(
-                    _AUTH_TOKEN_HEADER, context.invocation_metadata()
-                )
-            )
-            public_key = bytes_to_public_key(client_public_key_bytes)
+            # Check that a node exists for the public key before doing any
+            # cryptographic work, which unknown clients should not be able to trigger
+            node_id = self.state.get_node_id(client_public_key_bytes)
+            if node_id is None:
+                context.abort(grpc.StatusCode.UNAUTHENTICATED, "Access denied")
 
-            if not self._verify_hmac(public_key, request, hmac_value):
+            # Verify hmac value
+            hmac_value = metadata.get(_AUTH_TOKEN_HEADER, b"")
+            if not self._verify_hmac(
+                client_public_key_bytes, request_bytes, hmac_value
+            ):
                 context.abort(grpc.StatusCode.UNAUTHENTICATED, "Access denied")
 
             # Verify node_id
-            node_id = self.state.get_node_id(client_public_key_bytes)
-
-            if not self._verify_node_id(node_id, request):
+            # `context.abort` raises, but mypy does not know that `node_id` is set here
+            if not self._verify_node_id(cast(int, node_id), request):
                 context.abort(grpc.StatusCode.UNAUTHENTICATED, "Access denied")
 
             return method_handler.unary_unary(request, context)  # type: ignore
 
         return grpc.unary_unary_rpc_method_handler(
             _generic_method_handler,
-            request_deserializer=method_handler.request_deserializer,
+            request_deserializer=None,
             response_serializer=method_handler.response_serializer,
         )
 
-    def _verify_node_id(
-        self,
-        node_id: Optional[int],
-        request: Union[
-            DeleteNodeRequest,
-            PullTaskInsRequest,
-            PushTaskResRequest,
-            GetRunRequest,
-            PingRequest,
-        ],
-    ) -> bool:
-        if node_id is None:
+    def _verify_node_id(self, node_id: int, request: Request) -> bool:
+        verifier = _NODE_ID_VERIFIERS.get(type(request))
+        if verifier is None:
             return False
-        if isinstance(request, PushTaskResRequest):
-            if len(request.task_res_list) == 0:
-                return False
-            return request.task_res_list[0].task.producer.node_id == node_id
-        if isinstance(request, GetRunRequest):
-            return node_id in self.state.get_nodes(request.run_id)
-        return request.node.node_id == node_id
+        return verifier(self.state, node_id, request)
 
     def _verify_hmac(
-        self, public_key: ec.EllipticCurvePublicKey, request: Request, hmac_value: bytes
+        self, public_key_bytes: bytes, request_bytes: bytes, hmac_value: bytes
     ) -> bool:
-        shared_secret = generate_shared_key(self.server_private_key, public_key)
-        return verify_hmac(shared_secret, request.SerializeToString(True), hmac_value)
+        hmac_template = self._get_hmac_template(public_key_bytes)
+        return verify_hmac_with_template(hmac_template, request_bytes, hmac_value)
+
+    def _get_hmac_template(self, public_key_bytes: bytes) -> hmac.HMAC:
+        """Return the hmac context for `public_key_bytes`, creating it on a miss."""
+        # `dict.get` and `dict.setdefault` are atomic, so no lock is needed
+        hmac_template = self._hmac_template_cache.get(public_key_bytes)
+        if hmac_template is None:
+            shared_secret = generate_shared_key(
+                self.server_private_key, bytes_to_public_key(public_key_bytes)
+            )
+            hmac_template = self._hmac_template_cache.setdefault(
+                public_key_bytes, create_hmac_template(shared_secret)
+            )
+        return hmac_template
 
     def _create_authenticated_node(
         self,
@@ -191,14 +228,7 @@ class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
         request: CreateNodeRequest,
         context: grpc.ServicerContext,
     ) -> CreateNodeResponse:
-        context.send_initial_metadata(
-            (
-                (
-                    _PUBLIC_KEY_HEADER,
-                    self.encoded_server_public_key,
-                ),
-            )
-        )
+        context.send_initial_metadata(self._server_public_key_metadata)
 
         node_id = self.state.get_node_id(public_key_bytes)
 
@@ -212,4 +242,13 @@ class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
         # Handle `CreateNode` here instead of calling the default method handler
         # Note: the innermost `CreateNode` method will never be called
         node_id = self.state.create_node(request.ping_interval, public_key_bytes)
+        if node_id == 0:
+            # `create_node` is atomic per `public_key`, so a concurrent `CreateNode`
+            # for the same `public_key` may have registered it in the meantime
+            existing_node_id = self.state.get_node_id(public_key_bytes)
+            if existing_node_id is None:
+                context.abort(grpc.StatusCode.INTERNAL, "Node registration failed")
+            else:
+                node_id = existing_node_id
+                self.state.acknowledge_ping(node_id, request.ping_interval)
         return CreateNodeResponse(node=Node(node_id=node_id, anonymous=False))
@@ -15,8 +15,9 @@
 """Flower server interceptor tests."""
 
 
-import base64
 import unittest
+from typing import Optional
+from unittest.mock import patch
 
 import grpc
 
@@ -115,9 +116,7 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
     def test_successful_create_node_with_metadata(self) -> None:
         """Test server interceptor for creating node."""
         # Prepare
-        public_key_bytes = base64.urlsafe_b64encode(
-            public_key_to_bytes(self._client_public_key)
-        )
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
 
         # Execute
         response, call = self._create_node.with_call(
@@ -127,22 +126,44 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
 
         expected_metadata = (
             _PUBLIC_KEY_HEADER,
-            base64.urlsafe_b64encode(
-                public_key_to_bytes(self._server_public_key)
-            ).decode(),
+            public_key_to_bytes(self._server_public_key),
         )
 
         # Assert
         assert call.initial_metadata()[0] == expected_metadata
         assert isinstance(response, CreateNodeResponse)
 
+    def test_create_node_after_losing_race_with_metadata(self) -> None:
+        """Test server interceptor when a concurrent CreateNode registers first."""
+        # Prepare
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
+        node_id = self.state.create_node(ping_interval=30, public_key=public_key_bytes)
+        get_node_id = self.state.get_node_id
+        get_node_id_results = [None]
+
+        def _get_node_id(client_public_key: bytes) -> Optional[int]:
+            # Report no node on the first lookup only, as if the concurrent
+            # CreateNode registered the key right after this lookup
+            if get_node_id_results:
+                return get_node_id_results.pop()
+            return get_node_id(client_public_key)
+
+        # Execute
+        with patch.object(self.state, "get_node_id", side_effect=_get_node_id):
+            response, call = self._create_node.with_call(
+                request=CreateNodeRequest(),
+                metadata=((_PUBLIC_KEY_HEADER, public_key_bytes),),
+            )
+
+        # Assert
+        assert grpc.StatusCode.OK == call.code()
+        assert response.node.node_id == node_id
+
     def test_unsuccessful_create_node_with_metadata(self) -> None:
         """Test server interceptor for creating node unsuccessfully."""
         # Prepare
         _, client_public_key = generate_key_pairs()
-        public_key_bytes = base64.urlsafe_b64encode(
-            public_key_to_bytes(client_public_key)
-        )
+        public_key_bytes = public_key_to_bytes(client_public_key)
 
         # Execute & Assert
         with self.assertRaises(grpc.RpcError):
@@ -161,12 +182,8 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
         shared_secret = generate_shared_key(
             self._client_private_key, self._server_public_key
         )
-        hmac_value = base64.urlsafe_b64encode(
-            compute_hmac(shared_secret, request.SerializeToString(True))
-        )
-        public_key_bytes = base64.urlsafe_b64encode(
-            public_key_to_bytes(self._client_public_key)
-        )
+        hmac_value = compute_hmac(shared_secret, request.SerializeToString())
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
 
         # Execute
         response, call = self._delete_node.with_call(
@@ -181,6 +198,75 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
         assert isinstance(response, DeleteNodeResponse)
         assert grpc.StatusCode.OK == call.code()
 
+    def test_unsuccessful_pull_task_ins_without_node(self) -> None:
+        """Test server interceptor rejects a known key without a node early."""
+        # Prepare
+        request = PullTaskInsRequest(node=Node(node_id=1234))
+        shared_secret = generate_shared_key(
+            self._client_private_key, self._server_public_key
+        )
+        hmac_value = compute_hmac(shared_secret, request.SerializeToString())
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
+
+        # Execute & Assert
+        with patch(
+            "flwr.server.superlink.fleet.grpc_rere.server_interceptor"
+            ".generate_shared_key",
+            wraps=generate_shared_key,
+        ) as mock_generate_shared_key:
+            with self.assertRaises(grpc.RpcError):
+                self._pull_task_ins.with_call(
+                    request=request,
+                    metadata=(
+                        (_PUBLIC_KEY_HEADER, public_key_bytes),
+                        (_AUTH_TOKEN_HEADER, hmac_value),
+                    ),
+                )
+        mock_generate_shared_key.assert_not_called()
+
+    def test_unsuccessful_pull_task_ins_with_malformed_request(self) -> None:
+        """Test server interceptor rejects a request that cannot be decoded."""
+        # Prepare
+        self.state.create_node(
+            ping_interval=30, public_key=public_key_to_bytes(self._client_public_key)
+        )
+        pull_task_ins_bytes = self._channel.unary_unary(
+            "/flwr.proto.Fleet/PullTaskIns",
+            response_deserializer=PullTaskInsResponse.FromString,
+        )
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
+
+        # Execute & Assert
+        with self.assertRaises(grpc.RpcError) as context:
+            pull_task_ins_bytes.with_call(
+                request=b"\xff\xff\xff",
+                metadata=((_PUBLIC_KEY_HEADER, public_key_bytes),),
+            )
+        assert context.exception.code() == grpc.StatusCode.INVALID_ARGUMENT
+
+    def test_unsuccessful_pull_task_ins_with_other_node_id(self) -> None:
+        """Test server interceptor rejects a valid hmac for another node_id."""
+        # Prepare
+        node_id = self.state.create_node(
+            ping_interval=30, public_key=public_key_to_bytes(self._client_public_key)
+        )
+        request = PullTaskInsRequest(node=Node(node_id=node_id + 1))
+        shared_secret = generate_shared_key(
+            self._client_private_key, self._server_public_key
+        )
+        hmac_value = compute_hmac(shared_secret, request.SerializeToString())
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
+
+        # Execute & Assert
+        with self.assertRaises(grpc.RpcError):
+            self._pull_task_ins.with_call(
+                request=request,
+                metadata=(
+                    (_PUBLIC_KEY_HEADER, public_key_bytes),
+                    (_AUTH_TOKEN_HEADER, hmac_value),
+                ),
+            )
+
     def test_unsuccessful_delete_node_with_metadata(self) -> None:
         """Test server interceptor for deleting node unsuccessfully."""
         # Prepare
@@ -190,12 +276,8 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
         request = DeleteNodeRequest(node=Node(node_id=node_id))
         client_private_key, _ = generate_key_pairs()
         shared_secret = generate_shared_key(client_private_key, self._server_public_key)
-        hmac_value = base64.urlsafe_b64encode(
-            compute_hmac(shared_secret, request.SerializeToString(True))
-        )
-        public_key_bytes = base64.urlsafe_b64encode(
-            public_key_to_bytes(self._client_public_key)
-        )
+        hmac_value = compute_hmac(shared_secret, request.SerializeToString())
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
 
         # Execute & Assert
         with self.assertRaises(grpc.RpcError):
@@ -217,12 +299,8 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
         shared_secret = generate_shared_key(
             self._client_private_key, self._server_public_key
         )
-        hmac_value = base64.urlsafe_b64encode(
-            compute_hmac(shared_secret, request.SerializeToString(True))
-        )
-        public_key_bytes = base64.urlsafe_b64encode(
-            public_key_to_bytes(self._client_public_key)
-        )
+        hmac_value = compute_hmac(shared_secret, request.SerializeToString())
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
 
         # Execute
         response, call = self._pull_task_ins.with_call(
@@ -237,6 +315,38 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
         assert isinstance(response, PullTaskInsResponse)
         assert grpc.StatusCode.OK == call.code()
 
+    def test_shared_secret_is_cached(self) -> None:
+        """Test server interceptor computes the shared secret once per client."""
+        # Prepare
+        node_id = self.state.create_node(
+            ping_interval=30, public_key=public_key_to_bytes(self._client_public_key)
+        )
+        request = PullTaskInsRequest(node=Node(node_id=node_id))
+        shared_secret = generate_shared_key(
+            self._client_private_key, self._server_public_key
+        )
+        hmac_value = compute_hmac(shared_secret, request.SerializeToString())
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
+
+        # Execute
+        with patch(
+            "flwr.server.superlink.fleet.grpc_rere.server_interceptor"
+            ".generate_shared_key",
+            wraps=generate_shared_key,
+        ) as mock_generate_shared_key:
+            for _ in range(3):
+                _, call = self._pull_task_ins.with_call(
+                    request=request,
+                    metadata=(
+                        (_PUBLIC_KEY_HEADER, public_key_bytes),
+                        (_AUTH_TOKEN_HEADER, hmac_value),
+                    ),
+                )
+                assert grpc.StatusCode.OK == call.code()
+
+        # Assert
+        mock_generate_shared_key.assert_called_once()
+
     def test_unsuccessful_pull_task_ins_with_metadata(self) -> None:
         """Test server interceptor for pull task ins unsuccessfully."""
         # Prepare
@@ -246,12 +356,8 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
         request = PullTaskInsRequest(node=Node(node_id=node_id))
         client_private_key, _ = generate_key_pairs()
         shared_secret = generate_shared_key(client_private_key, self._server_public_key)
-        hmac_value = base64.urlsafe_b64encode(
-            compute_hmac(shared_secret, request.SerializeToString(True))
-        )
-        public_key_bytes = base64.urlsafe_b64encode(
-            public_key_to_bytes(self._client_public_key)
-        )
+        hmac_value = compute_hmac(shared_secret, request.SerializeToString())
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
 
         # Execute & Assert
         with self.assertRaises(grpc.RpcError):
@@ -275,12 +381,8 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
         shared_secret = generate_shared_key(
             self._client_private_key, self._server_public_key
         )
-        hmac_value = base64.urlsafe_b64encode(
-            compute_hmac(shared_secret, request.SerializeToString(True))
-        )
-        public_key_bytes = base64.urlsafe_b64encode(
-            public_key_to_bytes(self._client_public_key)
-        )
+        hmac_value = compute_hmac(shared_secret, request.SerializeToString())
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
 
         # Execute
         response, call = self._push_task_res.with_call(
@@ -306,15 +408,34 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
         )
         client_private_key, _ = generate_key_pairs()
         shared_secret = generate_shared_key(client_private_key, self._server_public_key)
-        hmac_value = base64.urlsafe_b64encode(
-            compute_hmac(shared_secret, request.SerializeToString(True))
+        hmac_value = compute_hmac(shared_secret, request.SerializeToString())
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
+
+        # Execute & Assert
+        with self.assertRaises(grpc.RpcError):
+            self._push_task_res.with_call(
+                request=request,
+                metadata=(
+                    (_PUBLIC_KEY_HEADER, public_key_bytes),
+                    (_AUTH_TOKEN_HEADER, hmac_value),
+                ),
+            )
+
+    def test_unsuccessful_push_task_res_without_task_res(self) -> None:
+        """Test server interceptor for push task res without any TaskRes."""
+        # Prepare
+        self.state.create_node(
+            ping_interval=30, public_key=public_key_to_bytes(self._client_public_key)
         )
-        public_key_bytes = base64.urlsafe_b64encode(
-            public_key_to_bytes(self._client_public_key)
+        request = PushTaskResRequest()
+        shared_secret = generate_shared_key(
+            self._client_private_key, self._server_public_key
         )
+        hmac_value = compute_hmac(shared_secret, request.SerializeToString())
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
 
         # Execute & Assert
-        with self.assertRaises(grpc.RpcError):
+        with self.assertRaises(grpc.RpcError) as err:
             self._push_task_res.with_call(
                 request=request,
                 metadata=(
@@ -322,6 +443,7 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
                     (_AUTH_TOKEN_HEADER, hmac_value),
                 ),
             )
+        assert err.exception.code() == grpc.StatusCode.UNAUTHENTICATED
 
     def test_successful_get_run_with_metadata(self) -> None:
         """Test server interceptor for pull task ins."""
@@ -334,12 +456,8 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
         shared_secret = generate_shared_key(
             self._client_private_key, self._server_public_key
         )
-        hmac_value = base64.urlsafe_b64encode(
-            compute_hmac(shared_secret, request.SerializeToString(True))
-        )
-        public_key_bytes = base64.urlsafe_b64encode(
-            public_key_to_bytes(self._client_public_key)
-        )
+        hmac_value = compute_hmac(shared_secret, request.SerializeToString())
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
 
         # Execute
         response, call = self._get_run.with_call(
@@ -364,12 +482,8 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
         request = GetRunRequest(run_id=run_id)
         client_private_key, _ = generate_key_pairs()
         shared_secret = generate_shared_key(client_private_key, self._server_public_key)
-        hmac_value = base64.urlsafe_b64encode(
-            compute_hmac(shared_secret, request.SerializeToString(True))
-        )
-        public_key_bytes = base64.urlsafe_b64encode(
-            public_key_to_bytes(self._client_public_key)
-        )
+        hmac_value = compute_hmac(shared_secret, request.SerializeToString())
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
 
         # Execute & Assert
         with self.assertRaises(grpc.RpcError):
@@ -391,12 +505,8 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
         shared_secret = generate_shared_key(
             self._client_private_key, self._server_public_key
         )
-        hmac_value = base64.urlsafe_b64encode(
-            compute_hmac(shared_secret, request.SerializeToString(True))
-        )
-        public_key_bytes = base64.urlsafe_b64encode(
-            public_key_to_bytes(self._client_public_key)
-        )
+        hmac_value = compute_hmac(shared_secret, request.SerializeToString())
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
 
         # Execute
         response, call = self._ping.with_call(
@@ -420,12 +530,8 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
         request = PingRequest(node=Node(node_id=node_id))
         client_private_key, _ = generate_key_pairs()
         shared_secret = generate_shared_key(client_private_key, self._server_public_key)
-        hmac_value = base64.urlsafe_b64encode(
-            compute_hmac(shared_secret, request.SerializeToString(True))
-        )
-        public_key_bytes = base64.urlsafe_b64encode(
-            public_key_to_bytes(self._client_public_key)
-        )
+        hmac_value = compute_hmac(shared_secret, request.SerializeToString())
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
 
         # Execute & Assert
         with self.assertRaises(grpc.RpcError):
@@ -439,9 +545,7 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
 
     def test_successful_restore_node(self) -> None:
         """Test server interceptor for restoring node."""
-        public_key_bytes = base64.urlsafe_b64encode(
-            public_key_to_bytes(self._client_public_key)
-        )
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
         response, call = self._create_node.with_call(
             request=CreateNodeRequest(),
             metadata=((_PUBLIC_KEY_HEADER, public_key_bytes),),
@@ -449,9 +553,7 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
 
         expected_metadata = (
             _PUBLIC_KEY_HEADER,
-            base64.urlsafe_b64encode(
-                public_key_to_bytes(self._server_public_key)
-            ).decode(),
+            public_key_to_bytes(self._server_public_key),
         )
 
         node = response.node
@@ -464,12 +566,8 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
         shared_secret = generate_shared_key(
             self._client_private_key, self._server_public_key
         )
-        hmac_value = base64.urlsafe_b64encode(
-            compute_hmac(shared_secret, request.SerializeToString(True))
-        )
-        public_key_bytes = base64.urlsafe_b64encode(
-            public_key_to_bytes(self._client_public_key)
-        )
+        hmac_value = compute_hmac(shared_secret, request.SerializeToString())
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
         response, call = self._delete_node.with_call(
             request=request,
             metadata=(
@@ -481,9 +579,7 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
         assert isinstance(response, DeleteNodeResponse)
         assert grpc.StatusCode.OK == call.code()
 
-        public_key_bytes = base64.urlsafe_b64encode(
-            public_key_to_bytes(self._client_public_key)
-        )
+        public_key_bytes = public_key_to_bytes(self._client_public_key)
         response, call = self._create_node.with_call(
             request=CreateNodeRequest(),
             metadata=((_PUBLIC_KEY_HEADER, public_key_bytes),),
@@ -491,9 +587,7 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
 
         expected_metadata = (
             _PUBLIC_KEY_HEADER,
-            base64.urlsafe_b64encode(
-                public_key_to_bytes(self._server_public_key)
-            ).decode(),
+            public_key_to_bytes(self._server_public_key),
         )
 
         assert call.initial_metadata()[0] == expected_metadata
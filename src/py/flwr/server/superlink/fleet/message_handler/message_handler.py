@@ -87,10 +87,20 @@ def pull_task_ins(request: PullTaskInsRequest, state: State) -> PullTaskInsRespo
 
 
 def push_task_res(request: PushTaskResRequest, state: State) -> PushTaskResResponse:
-    """Push TaskRes handler."""
-    # pylint: disable=no-member
-    task_res: TaskRes = request.task_res_list[0]
-    # pylint: enable=no-member
+    """Push TaskRes handler.
+
+    Raises
+    ------
+    ValueError
+        If `request.task_res_list` is empty. The Fleet API servicers reject such
+        requests before calling this handler.
+    """
+    # Validate task_res_list
+    task_res_list = request.task_res_list  # pylint: disable=no-member
+    if len(task_res_list) == 0:
+        raise ValueError("`task_res_list` must contain at least one TaskRes")
+
+    task_res: TaskRes = task_res_list[0]
 
     # Set pushed_at (timestamp in seconds)
     task_res.task.pushed_at = time.time()
@@ -17,6 +17,8 @@
 
 from unittest.mock import MagicMock
 
+import pytest
+
 from flwr.proto.fleet_pb2 import (  # pylint: disable=E0611
     CreateNodeRequest,
     DeleteNodeRequest,
@@ -126,3 +128,15 @@ def test_push_task_res() -> None:
     state.get_task_ins.assert_not_called()
     state.store_task_res.assert_called_once()
     state.get_task_res.assert_not_called()
+
+
+def test_push_task_res_empty() -> None:
+    """Test push_task_res without any TaskRes."""
+    # Prepare
+    request = PushTaskResRequest()
+    state = MagicMock()
+
+    # Execute & Assert
+    with pytest.raises(ValueError):
+        push_task_res(request=request, state=state)
+    state.store_task_res.assert_not_called()
@@ -135,6 +135,11 @@ async def push_task_res(request: Request) -> Response:  # Check if token is need
     # Deserialize ProtoBuf
     push_task_res_request_proto = PushTaskResRequest()
     push_task_res_request_proto.ParseFromString(push_task_res_request_bytes)
+    if len(push_task_res_request_proto.task_res_list) == 0:
+        raise HTTPException(
+            status_code=400,
+            detail="`task_res_list` must contain at least one TaskRes",
+        )
 
     # Get state from app
     state: State = app.state.STATE_FACTORY.state()
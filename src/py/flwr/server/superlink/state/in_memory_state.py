@@ -18,7 +18,7 @@
 import os
 import threading
 import time
-from logging import ERROR
+from logging import DEBUG, ERROR
 from typing import Dict, List, Optional, Set, Tuple
 from uuid import UUID, uuid4
 
@@ -223,10 +223,12 @@ class InMemoryState(State):  # pylint: disable=R0902,R0904
                 return 0
 
             if public_key is not None:
-                if (
-                    public_key in self.public_key_to_node_id
-                    or node_id in self.public_key_to_node_id.values()
-                ):
+                if public_key in self.public_key_to_node_id:
+                    # Expected when concurrent `CreateNode` calls race for the same key
+                    log(DEBUG, "A node is already registered for the public key.")
+                    return 0
+
+                if node_id in self.public_key_to_node_id.values():
                     log(ERROR, "Unexpected node registration failure.")
                     return 0
 
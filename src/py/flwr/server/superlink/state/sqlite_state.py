@@ -542,26 +542,32 @@ class SqliteState(State):  # pylint: disable=R0904
         # Sample a random int64 as node_id
         node_id: int = int.from_bytes(os.urandom(8), "little", signed=True)
 
-        query = "SELECT node_id FROM node WHERE public_key = :public_key;"
-        row = self.query(query, {"public_key": public_key})
-
-        if len(row) > 0:
-            log(ERROR, "Unexpected node registration failure.")
-            return 0
-
-        query = (
-            "INSERT INTO node "
-            "(node_id, online_until, ping_interval, public_key) "
-            "VALUES (?, ?, ?, ?)"
-        )
+        # Check for an existing node with the same `public_key` and insert the new
+        # node in a single statement, so both happen in one atomic round-trip
+        query = """
+            INSERT INTO node (node_id, online_until, ping_interval, public_key)
+            SELECT :node_id, :online_until, :ping_interval, :public_key
+            WHERE :public_key IS NULL
+            OR NOT EXISTS (SELECT 1 FROM node WHERE public_key = :public_key)
+            RETURNING node_id;
+        """
+        data = {
+            "node_id": node_id,
+            "online_until": time.time() + ping_interval,
+            "ping_interval": ping_interval,
+            "public_key": public_key,
+        }
 
         try:
-            self.query(
-                query, (node_id, time.time() + ping_interval, ping_interval, public_key)
-            )
+            rows = self.query(query, data)
         except sqlite3.IntegrityError:
             log(ERROR, "Unexpected node registration failure.")
             return 0
+
+        if len(rows) == 0:
+            # Expected when concurrent `CreateNode` calls race for the same key
+            log(DEBUG, "A node is already registered for the public key.")
+            return 0
         return node_id
 
     def delete_node(self, node_id: int, public_key: Optional[bytes] = None) -> None: